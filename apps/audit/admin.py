@@ -4,8 +4,23 @@
 
 from typing import Any, cast
 
+import pghistory.models
+from django.apps import apps
 from django.contrib import admin
+from django.contrib.admin.views.main import (
+    ALL_VAR,
+    ERROR_FLAG,
+    IS_FACETS_VAR,
+    IS_POPUP_VAR,
+    ORDER_VAR,
+    PAGE_VAR,
+    TO_FIELD_VAR,
+)
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import QuerySet
 from django.http import HttpRequest
+from django.utils.functional import cached_property
 from django.utils.html import format_html
 from django.utils.safestring import SafeString
 from django.utils.translation import gettext_lazy as _
@@ -14,6 +29,117 @@ from rangefilter.filters import DateTimeRangeFilter
 
 from apps.audit.models import KrononEvents
 
+# Сколько измененных полей показывать в колонке "Изменения" списка событий
+SHORT_DIFF_MAX_FIELDS = 3
+
+# Шаблон метки типа события
+_LABEL_HTML_TEMPLATE = '<b style="color:{}; white-space: nowrap;">{}</b>'
+
+# Цвет для неизвестных событий (серый)
+_UNKNOWN_LABEL_COLOR = "#6c757d"
+
+# Метки известных типов событий: (цвет, отображаемый текст)
+_LABELS = {
+    "insert": ("#28a745", "Создание"),  # Зеленый
+    "update": ("#ffc107", "Обновление"),  # Оранжевый
+    "soft_delete": ("#dc3545", "Мягкое удаление"),  # Красный
+    "restore": ("#007bff", "Восстановлен"),  # Синий
+    "delete": ("#000000", "Физ. удаление"),  # Черный (Hard Delete)
+}
+
+# Готовый HTML для известных типов событий (собирается один раз при импорте, а не на каждую строку списка)
+_LABELS_HTML: dict[str, SafeString] = {
+    label: format_html(_LABEL_HTML_TEMPLATE, color, display_text) for label, (color, display_text) in _LABELS.items()
+}
+
+# Кастомные колонки списка событий (добавляются к полям pghistory из settings)
+_EXTRA_LIST_DISPLAY = (
+    "obj_display",
+    "colored_label",
+    "service_display",
+    "user_email_display",
+    "correlation_id_display",
+    "ip_address_display",
+    "short_diff",
+)
+
+# Служебные GET-параметры changelist (страница, сортировка, popup и т.д.), которые не сужают выборку
+_CHANGELIST_NON_FILTER_PARAMS = frozenset(
+    {ALL_VAR, ERROR_FLAG, IS_FACETS_VAR, IS_POPUP_VAR, ORDER_VAR, PAGE_VAR, TO_FIELD_VAR}
+)
+
+# Кастомные фильтры списка событий
+_EXTRA_LIST_FILTER = (
+    # Фильтрация по дате на уровне БД (UI с календарём)
+    ("pgh_created_at", DateTimeRangeFilter),
+)
+
+
+def _estimate_events_count() -> int:
+    """
+    Оценивает общее количество событий по статистике планировщика (pg_class.reltuples).
+
+    Events - это UNION по всем таблицам событий pghistory, поэтому суммируем оценки всех таблиц.
+    Для таблиц, по которым еще не собиралась статистика, reltuples = -1 (считаем как 0).
+
+    Returns:
+        int: Оценочное количество событий (0, если статистики нет).
+    """
+    event_tables = [
+        model._meta.db_table
+        for model in apps.get_models()
+        if issubclass(model, pghistory.models.Event) and not model._meta.proxy
+    ]
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT COALESCE(SUM(GREATEST(reltuples, 0)), 0)::bigint FROM pg_class WHERE oid = ANY(%s::regclass[])",
+            [event_tables],
+        )
+        row = cursor.fetchone()
+
+    return int(row[0]) if row else 0
+
+
+def _is_unfiltered_events_query(object_list: Any) -> bool:
+    """
+    Проверяет, что QuerySet событий не сужен ни фильтрами, ни выбором таблиц событий.
+
+    Фильтры pghistory по модели событий и объекту (across/tracks/references) не трогают WHERE:
+    они сужают сам CTE (UNION по таблицам событий), сохраняя состояние в EventsQuery.
+
+    Args:
+        object_list (Any): Список объектов пагинатора (обычно QuerySet событий).
+
+    Returns:
+        bool: True, если выборка покрывает все события всех таблиц.
+    """
+    query = getattr(object_list, "query", None)
+
+    if query is None or query.where:
+        return False
+
+    return not any(getattr(query, attr, None) for attr in ("across", "tracks", "references"))
+
+
+class EstimatedCountPaginator(Paginator):  # type: ignore[type-arg]
+    """
+    Пагинатор журнала аудита с оценочным количеством строк.
+
+    Для нефильтрованного списка берет оценку из статистики Postgres вместо `SELECT COUNT(*)`
+    по UNION всех таблиц событий. При поиске/фильтрации (или отсутствии статистики) считает точно.
+    """
+
+    @cached_property
+    def count(self) -> int:
+        """Оценочное (без фильтров) или точное количество событий."""
+        # Фильтры и выбор таблиц событий сужают выборку - оценка по всем таблицам здесь неприменима
+        if not _is_unfiltered_events_query(self.object_list):
+            return super().count
+
+        # Если статистика еще не собрана (пустые/новые таблицы), считаем точно - это дешево
+        return _estimate_events_count() or super().count
+
 
 class KrononEventsAdmin(EventsAdmin):
     """
@@ -27,6 +153,9 @@ class KrononEventsAdmin(EventsAdmin):
     # Немного ускорит админку на больших объёмах
     list_per_page = 50
 
+    # Оценочный COUNT для нефильтрованного списка (без полного прохода по всем таблицам событий)
+    paginator = EstimatedCountPaginator
+
     search_fields = (
         "pgh_context__user_email",
         "pgh_context__correlation_id",
@@ -36,30 +165,35 @@ class KrononEventsAdmin(EventsAdmin):
     # Явно запрещаем массовые действия
     actions = None
 
+    def get_paginator(
+        self,
+        request: HttpRequest,
+        queryset: QuerySet[Any],
+        per_page: int,
+        orphans: int = 0,
+        allow_empty_first_page: bool = True,
+    ) -> Paginator[Any]:
+        """Использует оценочный COUNT только для списка без фильтров и поиска, иначе - точный COUNT."""
+        # Любой GET-параметр, кроме служебных (страница, сортировка и т.д.), - это фильтр или поиск
+        has_filters = any(param not in _CHANGELIST_NON_FILTER_PARAMS for param in request.GET)
+
+        paginator_class = Paginator if has_filters else self.paginator
+
+        return paginator_class(queryset, per_page, orphans, allow_empty_first_page)
+
     # Поля pghistory из settings + кастомные поля
     def get_list_display(self, request: HttpRequest) -> Any:
         """Расширяет отображение полей списка."""
         base_list_display = super().get_list_display(request)  # type: ignore[no-untyped-call]
 
-        return base_list_display + [
-            "obj_display",
-            "colored_label",
-            "service_display",
-            "user_email_display",
-            "correlation_id_display",
-            "ip_address_display",
-            "short_diff",
-        ]
+        return [*base_list_display, *_EXTRA_LIST_DISPLAY]
 
     # Базовые фильтры pghistory + кастомные фильтры
     def get_list_filter(self, request: HttpRequest) -> Any:
         """Расширяет фильтрацию списка."""
         base_list_filter = super().get_list_filter(request)  # type: ignore[no-untyped-call]
 
-        return base_list_filter + [
-            # Фильтрация по дате на уровне БД (UI с календарём)
-            ("pgh_created_at", DateTimeRangeFilter),
-        ]
+        return [*base_list_filter, *_EXTRA_LIST_FILTER]
 
     # --- UI helpers ---
 
@@ -126,29 +260,13 @@ class KrononEventsAdmin(EventsAdmin):
             else:
                 label = "restore"  # Сбросили дату в null — восстановили
 
-        # Маппинг цветов
-        colors = {
-            "insert": "#28a745",  # Зеленый
-            "update": "#ffc107",  # Оранжевый
-            "soft_delete": "#dc3545",  # Красный
-            "restore": "#007bff",  # Синий
-            "delete": "#000000",  # Черный (Hard Delete)
-        }
+        # Известные типы событий берем из заранее собранного HTML
+        label_html = _LABELS_HTML.get(label)
 
-        color = colors.get(label, "#6c757d")  # Серый для неизвестных событий
+        if label_html is not None:
+            return label_html
 
-        # Переводим метку для отображения
-        labels_map = {
-            "insert": "Создание",
-            "update": "Обновление",
-            "soft_delete": "Мягкое удаление",
-            "restore": "Восстановлен",
-            "delete": "Физ. удаление",
-        }
-
-        display_text = labels_map.get(label, label.upper())
-
-        return format_html('<b style="color:{}; white-space: nowrap;">{}</b>', color, display_text)
+        return format_html(_LABEL_HTML_TEMPLATE, _UNKNOWN_LABEL_COLOR, label.upper())
 
     @admin.display(description=_("Изменения"))
     def short_diff(self, obj: KrononEvents) -> str:
@@ -159,10 +277,16 @@ class KrononEventsAdmin(EventsAdmin):
         parts: list[str] = []
 
         for field, (old, new) in obj.pgh_diff.items():
-            if field != "updated_at":
-                parts.append(f"{field}: {old} → {new}")
+            if field == "updated_at":
+                continue
+
+            parts.append(f"{field}: {old} → {new}")
+
+            # Ограничиваем длину: форматируем только первые SHORT_DIFF_MAX_FIELDS полей, остальные не трогаем
+            if len(parts) == SHORT_DIFF_MAX_FIELDS:
+                break
 
-        return "; ".join(parts[:3])  # Ограничиваем длину
+        return "; ".join(parts)
 
     # --- Делаем историю неизменяемой (Read-only) ---
 
@@ -7,10 +7,13 @@ API Endpoints для Аудита (v1).
 from typing import Any
 from uuid import UUID
 
+import pghistory.models
+from django.db.models import QuerySet
 from django.http import HttpRequest
 from loguru import logger as log
 from ninja import Router
 from ninja.errors import HttpError
+from ninja.pagination import PageNumberPagination, paginate
 from ninja_jwt.authentication import AsyncJWTAuth
 
 from apps.audit.schemas import ClientHistoryOut
@@ -26,11 +29,14 @@ router = Router(auth=[AsyncJWTAuth(), AsyncApiKeyAuth()])
 
 
 @router.get("/clients/{client_id}", response={200: list[ClientHistoryOut], **STANDARD_ERRORS})
-async def get_client_history(request: HttpRequest, client_id: UUID) -> list[dict[str, Any]]:
+@paginate(PageNumberPagination, page_size=50)
+async def get_client_history(
+    request: HttpRequest, client_id: UUID
+) -> QuerySet[pghistory.models.Events, dict[str, Any]]:
     """
     Получить журнал аудита (историю изменений) клиента.
 
-    Возвращает список событий с диффами (разницами изменений) и контекстом операции.
+    Возвращает список событий с диффами (разницами изменений) и контекстом операции (с пагинацией).
     Доступно только системе и администраторам.
 
     Args:
@@ -43,7 +49,7 @@ async def get_client_history(request: HttpRequest, client_id: UUID) -> list[dict
         HttpError(404): Если клиент не найден.
 
     Returns:
-        list[dict[str, Any]]: Список событий изменения клиента.
+        QuerySet[Events, dict[str, Any]]: События изменения клиента (пагинация применяется декоратором).
     """
     # Достаем контекст аудита, собранный в Middleware
     audit_context = getattr(request, "audit_context", {})
@@ -62,8 +68,8 @@ async def get_client_history(request: HttpRequest, client_id: UUID) -> list[dict
     if not client_exists:
         raise HttpError(status_code=404, message="Клиент не найден")
 
-    # Получаем данные через селектор
-    history_data = await get_client_history_queryset(client_id=client_id)
+    # Получаем ленивый QuerySet через селектор: в БД идет только запрос страницы (LIMIT/OFFSET)
+    history_queryset = get_client_history_queryset(client_id=client_id)
 
-    # Возвращаем данные (Ninja сам преобразует словари в ClientHistoryOut)
-    return history_data
+    # Возвращаем QuerySet (Ninja сам применит пагинацию и преобразует словари событий в ClientHistoryOut)
+    return history_queryset
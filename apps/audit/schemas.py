@@ -7,7 +7,7 @@ from typing import Any
 from uuid import UUID
 
 from ninja import Schema
-from pydantic import Field
+from pydantic import AliasChoices, Field
 
 from apps.clients.models import ClientStatus, OrganizationType, TaxSystem
 
@@ -81,4 +81,9 @@ class ClientHistoryOut(Schema):
     pgh_context: HistoryContextMetadata | None = Field(default=None, description="Денормализованный контекст")
 
     # Snapshot данных (вложенная схема)
-    snapshot: ClientSnapshot = Field(..., description="Состояние объекта после изменения")
+    # Из модели Events читается напрямую из pgh_data (JSON поле со снэпшотом модели)
+    snapshot: ClientSnapshot = Field(
+        ...,
+        validation_alias=AliasChoices("snapshot", "pgh_data"),
+        description="Состояние объекта после изменения",
+    )
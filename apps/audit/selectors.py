@@ -2,37 +2,41 @@
 Селекторы (Read Logic) для приложения Audit.
 
 Отвечают за получение данных из БД.
-Используют асинхронный подход для неблокирующего ввода-вывода.
+Возвращают ленивые QuerySet'ы: выполнение (и пагинация) происходит на стороне вызывающего кода.
 """
 
 from typing import Any
 from uuid import UUID
 
 import pghistory.models
+from django.db.models import QuerySet
 
+from apps.clients.models import Client
 
-async def get_client_history_queryset(client_id: UUID) -> list[dict[str, Any]]:
+
+def get_client_history_queryset(client_id: UUID) -> QuerySet[pghistory.models.Events, dict[str, Any]]:
     """
-    Получает агрегированную историю изменений клиента с вычисленными диффами.
+    Возвращает QuerySet истории изменений клиента с вычисленными диффами.
 
     Использует глобальную модель `pghistory.models.Events` для доступа к `pgh_diff`.
+    Запрос ленивый: LIMIT/OFFSET накладывает пагинатор, поэтому из БД читается только одна страница событий.
+    Строки возвращаются словарями (.values()), без создания экземпляров модели Events.
 
     Args:
         client_id (UUID): Уникальный идентификатор клиента (UUIDv7).
 
     Returns:
-        list[dict[str, Any]]: Список словарей событий, готовых для сериализации в ClientHistoryOut.
+        QuerySet[Events, dict[str, Any]]: Ленивый QuerySet словарей событий для сериализации в ClientHistoryOut.
     """
-    # Используем глобальную модель Events, фильтруем вручную по модели и ID
-    # tracks() работает с объектами, а у нас ID + async, проще фильтровать сырым образом
-
-    events_queryset = (
-        pghistory.models.Events.objects.filter(
-            pgh_obj_model="clients.Client",
-            pgh_obj_id=client_id,
-        )
-        # Берем только нужные поля
-        .only(
+    # tracks() + across() кладут условие WHERE _event.pgh_obj_id = '<uuid>' внутрь ветки CTE по таблице ClientEvent:
+    # фильтр по сырому столбцу использует индекс FK pgh_obj, а события других клиентов не попадают в CTE.
+    # Фильтр .filter(pgh_obj_id=...) снаружи CTE сравнивал бы pgh_obj_id::TEXT и читал события всех клиентов.
+    # Для tracks() нужен только pk, поэтому передаем несохраненный экземпляр Client без запроса к БД
+    return (
+        pghistory.models.Events.objects.tracks(Client(pk=client_id))
+        .across("clients.ClientEvent")
+        # Берем только нужные поля, сразу словарями
+        .values(
             "pgh_id",
             "pgh_created_at",
             "pgh_label",
@@ -40,30 +44,6 @@ async def get_client_history_queryset(client_id: UUID) -> list[dict[str, Any]]:
             "pgh_context",
             "pgh_data",
         )
+        # Сортировка по CTE выполняется в памяти, но только по событиям одного клиента
         .order_by("-pgh_created_at")
     )
-
-    events_data = []
-
-    # Итерируемся асинхронно
-    async for event in events_queryset:
-        # Собираем контекст
-        context_data = event.pgh_context or {}  # pgh_context - JSON поле с денормализованным контекстом
-
-        # Собираем словарь, который Pydantic превратит в схему ClientSnapshot
-        snapshot_data = event.pgh_data or {}  # pgh_data - JSON поле со снэпшотом модели
-
-        # Собираем полный словарь событий
-        events_data.append(
-            {
-                "pgh_id": event.pgh_id,
-                "pgh_created_at": event.pgh_created_at,
-                "pgh_label": event.pgh_label,
-                "pgh_diff": event.pgh_diff,
-                "pgh_context": context_data,
-                "snapshot": snapshot_data,
-            }
-        )
-
-    # Возвращаем список словарей событий
-    return events_data
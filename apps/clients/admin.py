@@ -5,12 +5,43 @@
 from typing import Any
 
 from django.contrib import admin
+from django.db.models import QuerySet
 from django.http import HttpRequest
 from django.utils.translation import gettext_lazy as _
 
 from apps.clients.models import Client
 from apps.common.admin import KrononBaseAdmin
 
+# Фильтры списка клиентов (собираются один раз при импорте, а не на каждый запрос)
+_CLIENT_LIST_FILTER = (
+    "status",
+    "department",
+    "org_type",
+    "tax_system",
+    "accountant",
+    "primary_accountant",
+    "payroll_accountant",
+    "hr_specialist",
+)
+
+# Колонки, которые читаются для списка клиентов: поля list_display и __str__ связанных объектов
+# (JSON с контактами, полное название и поля служебных таблиц пользователей в список не тянем)
+_CLIENT_CHANGELIST_ONLY_FIELDS = (
+    "name",
+    "unp",
+    "org_type",
+    "tax_system",
+    "status",
+    "created_at",
+    "updated_at",
+    "deleted_at",
+    "department__name",
+    "accountant__email",
+    "primary_accountant__email",
+    "payroll_accountant__email",
+    "hr_specialist__email",
+)
+
 
 @admin.register(Client)
 class ClientAdmin(KrononBaseAdmin[Client]):
@@ -71,29 +102,30 @@ class ClientAdmin(KrononBaseAdmin[Client]):
 
     readonly_fields = ("created_at", "updated_at", "deleted_at")
 
-    # Автокомплит (поиск в выпадающем списке), чтобы список не тормозил, если юзеров станет много
-    autocomplete_fields = (
+    # Поля ввода ID с поиском во всплывающем окне: форма рендерится сразу, без AJAX-запросов автокомплита
+    # (ILIKE по таблице пользователей) на каждый из четырех виджетов
+    raw_id_fields = (
         "accountant",
         "primary_accountant",
         "payroll_accountant",
         "hr_specialist",
     )
 
-    # Кастомный SoftDeleteFilter фильтр + базовые фильтры
-    def get_list_filter(self, request: HttpRequest) -> list[Any]:
-        """Расширяет фильтрацию списка."""
+    def get_queryset(self, request: HttpRequest) -> QuerySet[Client]:
+        """Сужает SELECT до колонок списка на странице changelist (карточка клиента получает полный объект)."""
+        queryset = super().get_queryset(request)
 
-        soft_delete_filter = list(super().get_list_filter(request))
+        resolver_match = request.resolver_match
 
-        filters = [
-            "status",
-            "department",
-            "org_type",
-            "tax_system",
-            "accountant",
-            "primary_accountant",
-            "payroll_accountant",
-            "hr_specialist",
-        ]
+        # Имя URL changelist собираем из opts, чтобы оптимизация не отключилась молча при переименовании модели
+        changelist_url_name = f"{self.opts.app_label}_{self.opts.model_name}_changelist"
 
-        return soft_delete_filter + filters
+        if resolver_match and resolver_match.url_name == changelist_url_name:
+            queryset = queryset.only(*_CLIENT_CHANGELIST_ONLY_FIELDS)
+
+        return queryset
+
+    # Кастомный SoftDeleteFilter фильтр + базовые фильтры
+    def get_list_filter(self, request: HttpRequest) -> list[Any]:
+        """Расширяет фильтрацию списка."""
+        return [*super().get_list_filter(request), *_CLIENT_LIST_FILTER]
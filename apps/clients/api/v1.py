@@ -7,22 +7,23 @@ API Endpoints для Клиентов (v1).
 from typing import Annotated
 from uuid import UUID
 
-from django.http import HttpRequest
+from django.http import HttpRequest, HttpResponse
 from loguru import logger as log
 from ninja import Query, Router
 from ninja.errors import HttpError
-from ninja.pagination import PageNumberPagination, paginate
+from ninja.pagination import paginate
 from ninja_jwt.authentication import AsyncJWTAuth
 
 from apps.audit.utils import get_initiator_log_str
-from apps.clients.guards import get_client_for_admin_or_404, get_client_for_edit_or_404
+from apps.clients.guards import get_client_for_edit_or_404
 from apps.clients.models import Client
-from apps.clients.schemas.client import ClientCreate, ClientOut, ClientUpdate
+from apps.clients.schemas.client import ClientCreate, ClientListOut, ClientOut, ClientUpdate
 from apps.clients.schemas.filters import ClientFilter
 from apps.clients.selectors import get_client_queryset
 from apps.clients.services import create_client, delete_client, restore_client, update_client
 from apps.common.auth import AsyncApiKeyAuth
 from apps.common.managers import SoftDeleteQuerySet
+from apps.common.pagination import KeysetPagination
 from apps.common.permissions import is_admin_access
 from apps.common.schemas import STANDARD_ERRORS
 
@@ -30,16 +31,18 @@ from apps.common.schemas import STANDARD_ERRORS
 router = Router(auth=[AsyncJWTAuth(), AsyncApiKeyAuth()])
 
 
-@router.get("/", response={200: list[ClientOut], **STANDARD_ERRORS})
-@paginate(PageNumberPagination, page_size=20)
+@router.get("/", response={200: list[ClientListOut], **STANDARD_ERRORS})
+@paginate(KeysetPagination, page_size=20)
 async def list_clients(
     request: HttpRequest,
     filters: Annotated[ClientFilter, Query(...)],
 ) -> SoftDeleteQuerySet[Client]:
     """
-    Получить список клиентов с нативной OLP-фильтрацией, фильтрацией из запроса и пагинацией.
+    Получить список клиентов с нативной OLP-фильтрацией, фильтрацией из запроса и keyset-пагинацией.
     Доступно системе, администраторам и ответственным лицам.
 
+    Следующая страница запрашивается по курсору из ответа (`?cursor=<next_cursor>`).
+
     Args:
         request (HttpRequest): Объект входящего HTTP запроса.
         filters (ClientFilter): Параметры фильтрации из Query Params.
@@ -185,7 +188,7 @@ async def update_client_endpoint(request: HttpRequest, client_id: UUID, payload:
 
 
 @router.delete("/{client_id}", response={204: None, **STANDARD_ERRORS})
-async def delete_client_endpoint(request: HttpRequest, client_id: UUID) -> tuple[int, None]:
+async def delete_client_endpoint(request: HttpRequest, client_id: UUID) -> HttpResponse:
     """
     Мягкое удаление (Soft Delete) клиента.
 
@@ -202,7 +205,7 @@ async def delete_client_endpoint(request: HttpRequest, client_id: UUID) -> tuple
         HttpError(404): Если клиент не найден.
 
     Returns:
-        tuple[int, None]: Код ответа 204 (No Content), None
+        HttpResponse: Пустой ответ 204 (No Content)
     """
     # Достаем контекст аудита, собранный в Middleware
     audit_context = getattr(request, "audit_context", {})
@@ -211,14 +214,19 @@ async def delete_client_endpoint(request: HttpRequest, client_id: UUID) -> tuple
     initiator_str = get_initiator_log_str(audit_context)
     log.info(f"Initiator '{initiator_str}' attempts to delete client {client_id}.")
 
-    # Проверяем существование клиента и права (RBAC)
-    client = await get_client_for_admin_or_404(request=request, client_id=client_id)
+    # Проверяем права (RBAC): объект клиента для этого не нужен
+    await is_admin_access(request)
+
+    # Вызываем сервис удаления (один UPDATE, без предварительной выборки клиента)
+    is_deleted = await delete_client(client_id=client_id, audit_context=audit_context)
 
-    # Вызываем сервис удаления
-    await delete_client(client=client, audit_context=audit_context)
+    # Проверяем существование клиента по количеству обновленных строк
+    if not is_deleted:
+        raise HttpError(status_code=404, message="Клиент не найден")
 
-    # Возвращаем код ответа
-    return 204, None
+    # Возвращаем готовый пустой ответ: Ninja отдает HttpResponse как есть, без разрешения схемы и сериализации
+    # Схема 204 в декораторе остается только для документации OpenAPI
+    return HttpResponse(status=204)
 
 
 @router.patch("/{client_id}/restore", response={200: ClientOut, **STANDARD_ERRORS})
@@ -246,11 +254,15 @@ async def restore_client_endpoint(request: HttpRequest, client_id: UUID) -> Clie
     initiator_str = get_initiator_log_str(audit_context)
     log.info(f"Initiator '{initiator_str}' attempts to restore client {client_id}.")
 
-    # Проверяем существование клиента и права (RBAC)
-    client = await get_client_for_admin_or_404(request=request, client_id=client_id, is_deleted=True)
+    # Проверяем права (RBAC): объект клиента для этого не нужен
+    await is_admin_access(request)
+
+    # Вызываем сервис восстановления (UPDATE по удаленному клиенту, без предварительной выборки)
+    restored_client = await restore_client(client_id=client_id, audit_context=audit_context)
 
-    # Вызываем сервис восстановления
-    restored_client = await restore_client(client=client, audit_context=audit_context)
+    # Проверяем существование удаленного клиента по результату UPDATE
+    if restored_client is None:
+        raise HttpError(status_code=404, message="Клиент не найден")
 
     # Возвращаем восстановленного клиента
     return restored_client
@@ -2,6 +2,7 @@
 Гарды  для приложения Clients.
 """
 
+import asyncio
 from uuid import UUID
 
 from django.http import HttpRequest
@@ -10,7 +11,8 @@ from ninja.errors import HttpError
 
 from apps.clients.models import Client
 from apps.clients.selectors import get_client_by_id
-from apps.common.permissions import check_client_access, is_admin_access
+from apps.common.auth import get_auth_identity
+from apps.common.permissions import check_client_access
 
 
 async def get_client_or_404(client_id: UUID, is_deleted: bool = False) -> Client:
@@ -40,30 +42,6 @@ async def get_client_or_404(client_id: UUID, is_deleted: bool = False) -> Client
     return client
 
 
-async def get_client_for_admin_or_404(request: HttpRequest, client_id: UUID, is_deleted: bool = False) -> Client:
-    """
-    Проверяет существование клиента и RBAC-права (система/админ/директор/главбух).
-
-    Args:
-        request (HttpRequest): Объект входящего запроса.
-        client_id (UUID): Уникальный идентификатор клиента (UUIDv7).
-        is_deleted (bool): Флаг поиска по мягко удалённым клиентам.
-
-    Raises:
-        HttpError(404): Если клиент не найден.
-        HttpError(403): Если нет прав доступа.
-
-    Returns:
-        Client: Объект клиента.
-    """
-    client = await get_client_or_404(client_id=client_id, is_deleted=is_deleted)
-
-    # Проверка прав (RBAC)
-    await is_admin_access(request)
-
-    return client
-
-
 async def get_client_for_edit_or_404(request: HttpRequest, client_id: UUID) -> Client:
     """
     Проверяет существование клиента и права (RBAC + OLP).
@@ -79,9 +57,14 @@ async def get_client_for_edit_or_404(request: HttpRequest, client_id: UUID) -> C
     Returns:
         Client: Объект клиента.
     """
-    client = await get_client_or_404(client_id)
-
-    # Проверка прав (RBAC + OLP)
-    await check_client_access(request=request, client=client)
+    # Выборка клиента и получение пользователя запроса независимы, поэтому запускаем их одновременно
+    # (для API-ключа получение пользователя - это запрос системного пользователя к БД)
+    client, user = await asyncio.gather(
+        get_client_or_404(client_id),
+        get_auth_identity(request),
+    )
+
+    # Проверка прав (RBAC + OLP) - в памяти, по уже полученным клиенту и пользователю
+    check_client_access(user=user, client=client)
 
     return client
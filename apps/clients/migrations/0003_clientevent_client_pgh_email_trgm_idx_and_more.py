@@ -0,0 +1,28 @@
+# Generated by Django 6.0.2 on 2026-10-15 10:00
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.db.models.fields.json
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # Индексы на таблице событий строятся без блокировки записи (CREATE INDEX CONCURRENTLY)
+    atomic = False
+
+    dependencies = [
+        ('clients', '0002_initial'),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name='clientevent',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.fields.json.KeyTextTransform('user_email', 'pgh_context')), name='gin_trgm_ops'), name='client_pgh_email_trgm_idx'),
+        ),
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name='clientevent',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.fields.json.KeyTextTransform('ip_address', 'pgh_context')), name='gin_trgm_ops'), name='client_pgh_ip_trgm_idx'),
+        ),
+    ]
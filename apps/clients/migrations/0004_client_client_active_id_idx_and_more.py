@@ -0,0 +1,25 @@
+# Generated by Django 6.0.2 on 2026-10-15 10:00
+
+import django.contrib.postgres.operations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Индексы строятся без блокировки записи (CREATE INDEX CONCURRENTLY)
+    atomic = False
+
+    dependencies = [
+        ('clients', '0003_clientevent_client_pgh_email_trgm_idx_and_more'),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name='client',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['-id'], name='client_active_id_idx'),
+        ),
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name='client',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['status', '-id'], name='client_active_status_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 6.0.2 on 2026-10-15 10:00
+
+import apps.common.validators
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Индексы строятся и удаляются без блокировки записи (CONCURRENTLY)
+    atomic = False
+
+    dependencies = [
+        ('clients', '0004_client_client_active_id_idx_and_more'),
+    ]
+
+    operations = [
+        # Сначала строим новые индексы, чтобы поиск ни в какой момент не остался без индекса
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name='client',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='client_name_trgm_idx'),
+        ),
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name='client',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('full_legal_name'), name='gin_trgm_ops'), name='client_full_name_trgm_idx'),
+        ),
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name='client',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('unp'), name='gin_trgm_ops'), name='client_unp_trgm_idx'),
+        ),
+        django.contrib.postgres.operations.RemoveIndexConcurrently(
+            model_name='client',
+            name='client_search_gin_trgm_idx',
+        ),
+        migrations.AlterField(
+            model_name='client',
+            name='name',
+            field=models.CharField(help_text='Например: АБВ (для удобного поиска)', max_length=150, verbose_name='Краткое название'),
+        ),
+        migrations.AlterField(
+            model_name='client',
+            name='unp',
+            field=models.CharField(max_length=9, unique=True, validators=[apps.common.validators.validate_unp], verbose_name='УНП'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-15 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0005_client_client_name_trgm_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='client',
+            name='status',
+            field=models.CharField(choices=[('active', 'На обслуживании'), ('onboarding', 'Подключение (Договор)'), ('archived', 'Архив (Расторгнут)'), ('lead', 'Потенциальный')], default='onboarding', max_length=20, verbose_name='Статус'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 6.0.2 on 2026-10-15 10:00
+
+import django.contrib.postgres.operations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0006_alter_client_status'),
+    ]
+
+    operations = [
+        # Добавляем ограничение как NOT VALID: ACCESS EXCLUSIVE берется лишь на мгновение, без проверки существующих строк
+        # Существующие строки проверяются в отдельной миграции 0008 (своя транзакция, без удержания этой блокировки)
+        django.contrib.postgres.operations.AddConstraintNotValid(
+            model_name='client',
+            constraint=models.CheckConstraint(condition=models.Q(('unp__regex', '^\\d{9}$')), name='client_unp_9_digits', violation_error_message='УНП должен состоять из 9 цифр'),
+        ),
+    ]
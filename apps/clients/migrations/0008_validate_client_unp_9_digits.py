@@ -0,0 +1,20 @@
+# Generated by Django 6.0.2 on 2026-10-15 10:00
+
+import django.contrib.postgres.operations
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0007_client_client_unp_9_digits'),
+    ]
+
+    operations = [
+        # Проверяем существующие строки отдельно от ADD CONSTRAINT ... NOT VALID (миграция 0007):
+        # VALIDATE CONSTRAINT берет SHARE UPDATE EXCLUSIVE и не блокирует запись в таблицу на время сканирования
+        django.contrib.postgres.operations.ValidateConstraint(
+            model_name='client',
+            name='client_unp_9_digits',
+        ),
+    ]
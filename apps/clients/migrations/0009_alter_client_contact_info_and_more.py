@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-15 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0008_validate_client_unp_9_digits'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='client',
+            name='contact_info',
+            field=models.JSONField(blank=True, db_default=models.Value({}, output_field=models.JSONField()), default=dict, verbose_name='Контактная информация'),
+        ),
+        migrations.AlterField(
+            model_name='clientevent',
+            name='contact_info',
+            field=models.JSONField(blank=True, db_default=models.Value({}, output_field=models.JSONField()), default=dict, verbose_name='Контактная информация'),
+        ),
+    ]
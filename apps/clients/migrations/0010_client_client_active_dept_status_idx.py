@@ -0,0 +1,21 @@
+# Generated by Django 6.0.2 on 2026-10-15 10:00
+
+import django.contrib.postgres.operations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Индекс строится без блокировки записи (CREATE INDEX CONCURRENTLY)
+    atomic = False
+
+    dependencies = [
+        ('clients', '0009_alter_client_contact_info_and_more'),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name='client',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['department', 'status', '-id'], name='client_active_dept_status_idx'),
+        ),
+    ]
@@ -6,8 +6,10 @@
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 from pghistory import DeleteEvent, InsertEvent, UpdateEvent
 from pghistory import track as pghistory_track
@@ -74,6 +76,17 @@ class TaxSystem(models.TextChoices):
                 models.F("pgh_context__correlation_id"),
                 name="client_pgh_corr_idx",
             ),
+            # Триграммные GIN индексы для поиска в админке аудита (icontains по email и IP инициатора)
+            # Django строит icontains как UPPER(pgh_context ->> 'key') LIKE UPPER(...), поэтому индексируем
+            # именно это выражение - иначе планировщик не сможет использовать индекс
+            GinIndex(
+                OpClass(Upper(KeyTextTransform("user_email", "pgh_context")), name="gin_trgm_ops"),
+                name="client_pgh_email_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper(KeyTextTransform("ip_address", "pgh_context")), name="gin_trgm_ops"),
+                name="client_pgh_ip_trgm_idx",
+            ),
         ],
     },
 )
@@ -91,7 +104,6 @@ class Client(BaseModel):
     name = models.CharField(
         _("Краткое название"),
         max_length=150,
-        db_index=True,
         help_text=_("Например: АБВ (для удобного поиска)"),
     )
 
@@ -107,7 +119,6 @@ class Client(BaseModel):
         _("УНП"),
         max_length=9,
         unique=True,
-        db_index=True,
         validators=[validate_unp],
     )
 
@@ -116,7 +127,6 @@ class Client(BaseModel):
         max_length=20,
         choices=ClientStatus.choices,
         default=ClientStatus.ONBOARDING,
-        db_index=True,
     )
 
     org_type = models.CharField(
@@ -212,6 +222,8 @@ class Client(BaseModel):
     contact_info = models.JSONField(
         _("Контактная информация"),
         default=dict,
+        # Дефолт и на стороне БД: INSERT в обход ORM (bulk_create без поля, raw SQL) не упадет на NOT NULL
+        db_default=models.Value({}, output_field=models.JSONField()),
         blank=True,
     )
 
@@ -229,12 +241,50 @@ class Client(BaseModel):
 
         # Индексы для оптимизации поиска
         indexes = [
-            # GIN индекс для Trigram поиска
-            # Позволяет делать ILIKE '%запрос%' по любому из трех полей очень быстро
+            # GIN индексы для Trigram поиска: отдельный индекс на каждое поле поиска
+            # Django строит `icontains` как `UPPER(col::text) LIKE UPPER('%запрос%')`, поэтому индексируем UPPER(col)
+            # Поиск объединяет поля через OR - планировщик использует BitmapOr по трем индексам
             GinIndex(
-                name="client_search_gin_trgm_idx",
-                fields=["name", "full_legal_name", "unp"],
-                opclasses=["gin_trgm_ops", "gin_trgm_ops", "gin_trgm_ops"],
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="client_name_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("full_legal_name"), name="gin_trgm_ops"),
+                name="client_full_name_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("unp"), name="gin_trgm_ops"),
+                name="client_unp_trgm_idx",
+            ),
+            # Частичные индексы под список клиентов: только активные, порядок "новые сверху" (-id, UUIDv7)
+            # Keyset-страница (`id < cursor ORDER BY id DESC LIMIT N`) читается диапазоном по индексу без сортировки
+            models.Index(
+                name="client_active_id_idx",
+                fields=["-id"],
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            # То же с фильтром по статусу (самый частый фильтр списка)
+            models.Index(
+                name="client_active_status_idx",
+                fields=["status", "-id"],
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            # Список клиентов отдела с фильтром по статусу (`?department_id=...&status=...`)
+            # Фильтр по одному отделу без статуса обслуживает стандартный FK-индекс department_id
+            models.Index(
+                name="client_active_dept_status_idx",
+                fields=["department", "status", "-id"],
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
+
+        # Ограничения целостности на уровне БД
+        constraints = [
+            # УНП - ровно 9 цифр (контрольную сумму проверяет validate_unp, здесь - страховка от записи в обход валидации)
+            models.CheckConstraint(
+                condition=models.Q(unp__regex=r"^\d{9}$"),
+                name="client_unp_9_digits",
+                violation_error_message=_("УНП должен состоять из 9 цифр"),
             ),
         ]
 
@@ -269,25 +319,40 @@ class Client(BaseModel):
         Args:
             data (ContactInfo): Новые данные.
         """
+        # Ни одно поле не задано - результат заведомо пустой, model_dump не нужен
+        if not data.model_fields_set:
+            self.contact_info = {}
+            return None
+
         # mode="json" гарантирует, что UUID/Enums станут строками
         # exclude_unset=True: не сохранять дефолты (Field(None))
         # exclude_none=True: не сохранять поля, где явно стоит None
         clean_data = data.model_dump(mode="json", exclude_unset=True, exclude_none=True)
         self.contact_info = clean_data
 
-    def patch_contact_data(self, data: ClientContactInfoUpdate) -> None:
+        return None
+
+    def patch_contact_data(self, data: ClientContactInfoUpdate) -> bool:
         """
         Частично обновляет JSON-поле contact_info.
 
         Стратегия слияния:
         1. Берем текущий словарь из БД.
         2. Берем только те поля из data, которые были явно переданы (exclude_unset).
-        3. Обновляем (merge) словарь верхнего уровня.
-        4. Вложенные списки (contacts) заменяются целиком, если они переданы.
+        3. Если все переданные значения совпадают с текущими - ничего не меняем.
+        4. Обновляем (merge) словарь верхнего уровня.
+        5. Вложенные списки (contacts) заменяются целиком, если они переданы.
 
         Args:
             data (ClientContactInfoUpdate): Схема с изменениями.
+
+        Returns:
+            bool: True, если contact_info изменился (нужно сохранять), иначе False.
         """
+        # Пустой PATCH контактов (`{"contact_info": {}}`) - ничего не меняем, model_dump не нужен
+        if not data.model_fields_set:
+            return False
+
         # Гарантируем, что работаем со словарем
         current_data = self.contact_info if isinstance(self.contact_info, dict) else {}
 
@@ -296,15 +361,15 @@ class Client(BaseModel):
         # exclude_none=False: Разрешаем null, чтобы удалять значения полей
         updates = data.model_dump(exclude_unset=True, mode="json")
 
-        # Нечего обновлять
-        if not updates:
-            return None
+        # Нечего обновлять или все значения уже совпадают (повторный PATCH) - поле не трогаем
+        if all(key in current_data and current_data[key] == value for key, value in updates.items()):
+            return False
 
         # Используем распаковку для создания нового словаря
         # Значения из updates перезапишут значения из current_data
         self.contact_info = {**current_data, **updates}
 
-        return None
+        return True
 
     @classmethod
     def get_olp_filter(cls, user_id: UUID) -> models.Q:
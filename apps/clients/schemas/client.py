@@ -105,9 +105,10 @@ class ClientUpdate(Schema):
     google_folder_id: str | None = Field(default=None, max_length=100, description="Обновить ID папки на Google Drive")
 
 
-class ClientOut(Schema):
+class ClientListOut(Schema):
     """
-    Схема для вывода данных о клиенте (ответ API).
+    Схема для вывода клиента в списке (ответ API).
+    Без контактов и интеграций: эти колонки не читаются из БД для страницы списка.
     """
 
     # Брать данные из ORM объектов (в Ninja Schema включено по умолчанию)
@@ -131,8 +132,14 @@ class ClientOut(Schema):
     payroll_accountant: UserOut | None = Field(default=None, description="Бухгалтер по заработной плате")
     hr_specialist: UserOut | None = Field(default=None, description="Специалист по кадрам")
 
-    contact_info: ClientContactInfo | None = Field(default=None, description="Структурированные контактные данные")
-    google_folder_id: str | None = Field(default=None, description="ID папки Google Drive")
-
     created_at: datetime = Field(..., description="Дата и время создания клиента")
     updated_at: datetime = Field(..., description="Дата и время последнего изменения клиента")
+
+
+class ClientOut(ClientListOut):
+    """
+    Схема для вывода полных данных о клиенте (ответ API).
+    """
+
+    contact_info: ClientContactInfo | None = Field(default=None, description="Структурированные контактные данные")
+    google_folder_id: str | None = Field(default=None, description="ID папки Google Drive")
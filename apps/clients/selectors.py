@@ -12,6 +12,42 @@ from loguru import logger as log
 from apps.clients.models import Client
 from apps.common.managers import SoftDeleteQuerySet
 
+# Связи клиента с ответственными пользователями
+_CLIENT_USER_RELATIONS = ("accountant", "primary_accountant", "payroll_accountant", "hr_specialist")
+
+# Все связи клиента, которые разворачиваются во вложенные объекты ответа API (JOIN через select_related)
+CLIENT_RELATIONS = ("department", *_CLIENT_USER_RELATIONS)
+
+# Поля связанных пользователей, необходимые для UserOut (без пароля, прав и прочих служебных колонок)
+_USER_ONLY_FIELDS = ("id", "email", "last_name", "first_name", "middle_name", "role")
+
+# Поля связанного отдела, необходимые для DepartmentOut
+_DEPARTMENT_ONLY_FIELDS = ("id", "name")
+
+# Колонки, которые реально читаются из БД для клиента и его связей (SELECT без лишней ширины)
+_CLIENT_ONLY_FIELDS = (
+    # Собственные поля клиента (все, чтобы save() на загруженном объекте не терял данные)
+    "id",
+    "name",
+    "full_legal_name",
+    "unp",
+    "status",
+    "org_type",
+    "tax_system",
+    *CLIENT_RELATIONS,
+    "contact_info",
+    "google_folder_id",
+    "created_at",
+    "updated_at",
+    "deleted_at",
+    # Поля связей
+    *(f"department__{field}" for field in _DEPARTMENT_ONLY_FIELDS),
+    *(f"{relation}__{field}" for relation in _CLIENT_USER_RELATIONS for field in _USER_ONLY_FIELDS),
+)
+
+# Тяжелые колонки, которые не нужны в списке клиентов (ClientListOut): JSON контактов и интеграции
+_CLIENT_LIST_DEFERRED_FIELDS = ("contact_info", "google_folder_id")
+
 
 def _get_base_client_queryset(is_deleted: bool = False) -> SoftDeleteQuerySet[Client]:
     """
@@ -19,7 +55,7 @@ def _get_base_client_queryset(is_deleted: bool = False) -> SoftDeleteQuerySet[Cl
 
     Если передан флаг is_deleted=True, формирует QuerySet по мягко удалённым клиентам.
     Применяет `select_related` для всех связанных полей, необходимых в API,
-    чтобы избежать проблемы N+1 запросов.
+    чтобы избежать проблемы N+1 запросов, и `only` для сужения JOIN'ов до полей схем ответа.
     Гарантирует сортировку по ID (в обратном порядке).
 
     Args:
@@ -35,13 +71,9 @@ def _get_base_client_queryset(is_deleted: bool = False) -> SoftDeleteQuerySet[Cl
     search_clients = Client.objects.deleted() if is_deleted else Client.objects.active()
 
     return (
-        search_clients.select_related(
-            "department",
-            "accountant",
-            "primary_accountant",
-            "payroll_accountant",
-            "hr_specialist",
-        ).order_by("-id")  # Оптимизация N+1  # Гарантируем сортировку
+        search_clients.select_related(*CLIENT_RELATIONS)  # Оптимизация N+1
+        .only(*_CLIENT_ONLY_FIELDS)  # Не тянем из связанных таблиц колонки, которых нет в схемах ответа
+        .order_by("-id")  # Гарантируем сортировку
     )
 
 
@@ -50,6 +82,7 @@ def get_client_queryset(user_id: UUID, is_admin: bool) -> SoftDeleteQuerySet[Cli
     Возвращает оптимизированный QuerySet для списка клиентов с учетом прав доступа (OLP).
 
     Применяет OLP-фильтрацию по пользователю.
+    Не загружает колонки, отсутствующие в схеме списка (`ClientListOut`).
 
     Args:
         user_id (UUID): ID инициатора запроса для OLP-фильтрации.
@@ -58,7 +91,11 @@ def get_client_queryset(user_id: UUID, is_admin: bool) -> SoftDeleteQuerySet[Cli
     Returns:
         SoftDeleteQuerySet[Client]: Оптимизированный QuerySet с OLP-фильтрацией.
     """
-    return _get_base_client_queryset().for_user(user_id, is_admin)  # OLP-фильтрация
+    return (
+        _get_base_client_queryset()
+        .defer(*_CLIENT_LIST_DEFERRED_FIELDS)  # Сужаем строки списка
+        .for_user(user_id, is_admin)  # OLP-фильтрация
+    )
 
 
 async def get_client_by_id(client_id: UUID, is_deleted: bool = False) -> Client | None:
@@ -82,6 +119,6 @@ async def get_client_by_id(client_id: UUID, is_deleted: bool = False) -> Client
         return await queryset.filter(id=client_id).afirst()
 
     except Exception as exc:
-        log.error(f"DB Error while fetching client. ID: {client_id}: {exc}")
+        log.error("DB Error while fetching client. ID: {}: {}", client_id, exc)
         # Глобальный хендлер превратит это в 500
         raise
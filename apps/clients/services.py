@@ -5,13 +5,18 @@
 """
 
 from typing import Any
+from uuid import UUID
 
 from loguru import logger as log
 
 from apps.audit.utils import aexecute_with_audit
 from apps.clients.models import Client
 from apps.clients.schemas.client import ClientCreate, ClientUpdate
-from apps.clients.selectors import get_client_by_id
+from apps.clients.selectors import CLIENT_RELATIONS, get_client_by_id
+
+# FK-поля клиента, которые в ответе API разворачиваются во вложенные объекты (department, accountant и т.д.)
+# Выводятся из списка связей селекторов, чтобы оба списка не расходились
+_CLIENT_RELATION_ID_FIELDS = tuple(f"{relation}_id" for relation in CLIENT_RELATIONS)
 
 
 async def create_client(data: ClientCreate, audit_context: dict[str, Any]) -> Client:
@@ -23,10 +28,10 @@ async def create_client(data: ClientCreate, audit_context: dict[str, Any]) -> Cl
         audit_context (dict[str, Any]): Словарь контекста аудита.
 
     Returns:
-        Client: Созданный объект клиента с подгруженными связями.
+        Client: Созданный объект клиента с подгруженными связями (если они заданы).
     """
     # Логируем бизнес-контекст операции
-    log.info(f"Creating client. UNP: {data.unp}, Name: {data.name}")
+    log.info("Creating client. UNP: {}, Name: {}", data.unp, data.name)
 
     try:
         # Формируем основной payload для полей модели (name, unp, accountant_id и т.д.)
@@ -46,15 +51,20 @@ async def create_client(data: ClientCreate, audit_context: dict[str, Any]) -> Cl
         # Выполняем .create() асинхронно через утилиту (функцию-обертку с аудитом)
         client = await aexecute_with_audit(audit_context=audit_context, sync_func=Client.objects.create, **payload)
 
-        log.info(f"Client created. ID: {client.id}")
+        log.info("Client created. ID: {}", client.id)
+
+        # Если связи не переданы, объект после INSERT уже содержит все поля для ClientOut
+        # (пустые FK разворачиваются в None без запросов к БД), поэтому повторный SELECT не нужен
+        if not any(payload.get(field) for field in _CLIENT_RELATION_ID_FIELDS):
+            return client
 
-        # .acreate возвращает "чистый" объект (ID и базовые поля), а схема ClientOut требует вложенных объектов
+        # .create возвращает "чистый" объект (ID и базовые поля), а схема ClientOut требует вложенных объектов
         # Делаем рефреш через селектор с подгрузкой связей (department, accountant и т.д.) для корректного ответа API
         full_client = await get_client_by_id(client.id)
 
         # Теоретически невозможно, что его нет, но для Mypy:
         if not full_client:
-            log.critical(f"Client {client.id} disappeared after creation!")
+            log.critical("Client {} disappeared after creation!", client.id)
             raise RuntimeError(f"Client {client.id} not found immediately after creation.")
 
         # Возвращаем созданный объект с полными данными
@@ -62,7 +72,7 @@ async def create_client(data: ClientCreate, audit_context: dict[str, Any]) -> Cl
 
     except Exception as exc:
         # Логируем контекст ошибки перед тем, как она уйдет в глобальный хендлер
-        log.error(f"Error creating client (UNP: {data.unp}): {exc}")
+        log.error("Error creating client (UNP: {}): {}", data.unp, exc)
         raise
 
 
@@ -82,8 +92,8 @@ async def update_client(client: Client, data: ClientUpdate, audit_context: dict[
         Client: Обновленный объект клиента с подгруженными связями.
     """
     # Логируем, какие поля меняются
-    changed_fields = data.model_dump(exclude_unset=True).keys()
-    log.info(f"Updating client {client.id}. Fields: {list(changed_fields)}")
+    # model_fields_set - это ровно ключи model_dump(exclude_unset=True), но без сериализации модели
+    log.info("Updating client {}. Fields: {}", client.id, sorted(data.model_fields_set))
 
     try:
         # Формируем основной payload для полей модели (name, unp, accountant_id и т.д.)
@@ -99,22 +109,38 @@ async def update_client(client: Client, data: ClientUpdate, audit_context: dict[
             setattr(client, field, value)
 
         # Обновляем JSON поле через метод модели (умное слияние)
-        if contact_info_update is not None:
-            # Передаем Pydantic-схему в метод модели
-            # Метод модели сам вызовет model_dump(mode="json")
-            client.patch_contact_data(contact_info_update)
+        # Передаем Pydantic-схему в метод модели, метод сам вызовет model_dump(mode="json")
+        # и вернет False, если контакты не изменились
+        is_contact_info_changed = contact_info_update is not None and client.patch_contact_data(contact_info_update)
+
+        # Нечего сохранять: полей модели нет, а контакты совпадают с текущими - не пишем в БД и не плодим событие аудита
+        if not payload and not is_contact_info_changed:
+            log.debug("Client {} unchanged, skipping save.", client.id)
+            return client
+
+        # Обновляем только реально переданные колонки (+ updated_at: auto_now пишется, только если указан явно)
+        update_fields = [*payload.keys(), "updated_at"]
+
+        if is_contact_info_changed:
+            update_fields.append("contact_info")
 
         # Выполняем .save() асинхронно через утилиту (функцию-обертку с аудитом)
-        await aexecute_with_audit(audit_context=audit_context, sync_func=client.save)
+        await aexecute_with_audit(audit_context=audit_context, sync_func=client.save, update_fields=update_fields)
 
-        log.debug(f"Client updated: {client.id}")
+        log.debug("Client updated: {}", client.id)
 
-        # Делаем рефреш через селектор с подгрузкой связей (актуальные связи и updated_at) для корректного ответа API
+        # Объект получен селектором с подгруженными связями, а updated_at проставлен при save()
+        # Если связи не менялись, он уже актуален - повторный SELECT не нужен
+        if payload.keys().isdisjoint(_CLIENT_RELATION_ID_FIELDS):
+            return client
+
+        # Связи изменились: Django сбросил кэш связанных объектов, а ленивая подгрузка в async-контексте невозможна
+        # Делаем рефреш через селектор с подгрузкой связей для корректного ответа API
         updated_client = await get_client_by_id(client_id=client.id)
 
         # Теоретически невозможно, что его нет, но для Mypy:
         if not updated_client:
-            log.critical(f"Client {client.id} disappeared after update!")
+            log.critical("Client {} disappeared after update!", client.id)
             raise RuntimeError("Client not found after update")
 
         # Возвращаем актуальные данные
@@ -122,58 +148,81 @@ async def update_client(client: Client, data: ClientUpdate, audit_context: dict[
 
     except Exception as exc:
         # Логируем контекст ошибки перед тем, как она уйдет в глобальный хендлер
-        log.error(f"Error updating client {client.id}: {exc}")
+        log.error("Error updating client {}: {}", client.id, exc)
         raise
 
 
-async def delete_client(client: Client, audit_context: dict[str, Any]) -> None:
+async def delete_client(client_id: UUID, audit_context: dict[str, Any]) -> bool:
     """
-    Выполняет мягкое удаление клиента.
+    Выполняет мягкое удаление клиента одним UPDATE-запросом (без предварительного SELECT).
 
     Args:
-        client (Client): Объект клиента.
+        client_id (UUID): Уникальный идентификатор клиента (UUIDv7).
         audit_context (dict[str, Any]): Словарь контекста аудита.
+
+    Returns:
+        bool: True, если клиент был удален; False, если активный клиент с таким ID не найден.
     """
-    log.info(f"Start deleting client {client.id} (Soft Delete).")
+    log.info("Start deleting client {} (Soft Delete).", client_id)
 
     try:
-        # Выполняем кастомный .delete() асинхронно через утилиту (функцию-обертку с аудитом)
-        # Soft delete - UPDATE запрос (ставит текущее время в deleted_at)
-        await aexecute_with_audit(audit_context=audit_context, sync_func=client.delete)
+        # Выполняем .delete() QuerySet'а асинхронно через утилиту (функцию-обертку с аудитом)
+        # Soft delete - один UPDATE запрос (ставит текущее время в deleted_at) только по активному клиенту
+        # Количество обновленных строк заодно служит проверкой существования
+        deleted_count, _ = await aexecute_with_audit(
+            audit_context=audit_context,
+            sync_func=Client.objects.active().filter(id=client_id).delete,
+        )
+
+        if not deleted_count:
+            log.warning("Client {} not found for deletion.", client_id)
+            return False
 
-        log.info(f"Client {client.id} marked as deleted.")
+        log.info("Client {} marked as deleted.", client_id)
+        return True
 
     except Exception as exc:
         # Логируем контекст ошибки перед тем, как она уйдет в глобальный хендлер
-        log.error(f"Error deleting client {client.id}: {exc}")
+        log.error("Error deleting client {}: {}", client_id, exc)
         raise
 
 
-async def restore_client(client: Client, audit_context: dict[str, Any]) -> Client:
+async def restore_client(client_id: UUID, audit_context: dict[str, Any]) -> Client | None:
     """
     Выполняет восстановление клиента после мягкого удаления.
 
+    Восстановление выполняется одним UPDATE-запросом по удаленному клиенту (без предварительного SELECT),
+    количество обновленных строк служит проверкой существования.
+
     Args:
-        client (Client): Объект клиента.
+        client_id (UUID): Уникальный идентификатор клиента (UUIDv7).
         audit_context (dict[str, Any]): Словарь контекста аудита.
 
     Returns:
-        Client: Восстановленный объект клиента с подгруженными связями.
+        Client | None: Восстановленный объект клиента с подгруженными связями или None, если удаленный клиент не найден.
     """
-    log.info(f"Start restoring client {client.id}.")
+    log.info("Start restoring client {}.", client_id)
 
     try:
-        # Выполняем кастомный .restore() асинхронно через утилиту (функцию-обертку с аудитом)
-        # Restore - UPDATE запрос (ставит Null в deleted_at)
-        await aexecute_with_audit(audit_context=audit_context, sync_func=client.restore)
-        log.info(f"Client {client.id} restored.")
+        # Выполняем .restore() QuerySet'а асинхронно через утилиту (функцию-обертку с аудитом)
+        # Restore - UPDATE запрос (ставит Null в deleted_at) только по мягко удаленному клиенту
+        restored_count = await aexecute_with_audit(
+            audit_context=audit_context,
+            sync_func=Client.objects.deleted().filter(id=client_id).restore,
+        )
+
+        if not restored_count:
+            log.warning("Deleted client {} not found for restore.", client_id)
+            return None
+
+        log.info("Client {} restored.", client_id)
 
         # Делаем рефреш через селектор с подгрузкой связей (актуальные связи и updated_at) для корректного ответа API
-        restored_client = await get_client_by_id(client_id=client.id)
+        restored_client = await get_client_by_id(client_id=client_id)
 
         # Теоретически невозможно, что его нет, но для Mypy:
         if not restored_client:
-            log.critical(f"Client {client.id} disappeared after restore!")
+            log.critical("Client {} disappeared after restore!", client_id)
             raise RuntimeError("Client not found after restore")
 
         # Возвращаем актуальные данные
@@ -181,5 +230,5 @@ async def restore_client(client: Client, audit_context: dict[str, Any]) -> Clien
 
     except Exception as exc:
         # Логируем контекст ошибки перед тем, как она уйдет в глобальный хендлер
-        log.error(f"Error restoring client {client.id}: {exc}")
+        log.error("Error restoring client {}: {}", client_id, exc)
         raise
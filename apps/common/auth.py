@@ -61,7 +61,7 @@ async def get_auth_identity(request: HttpRequest) -> User:
 
     # Если аутентификация по API-ключу (auth будет строкой "system_api")
     if identity == "system_api":
-        # Возвращаем системного юзера из БД (Django кэширует get)
+        # Возвращаем системного юзера из БД
         system_user: User = await User.objects.aget(id=SYSTEM_USER_ID)
         return system_user
 
@@ -0,0 +1,94 @@
+"""
+Классы пагинации для API (Django Ninja).
+"""
+
+from typing import Any
+from uuid import UUID
+
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from ninja import Field, Schema
+from ninja.pagination import AsyncPaginationBase
+
+
+class KeysetPagination(AsyncPaginationBase):
+    """
+    Keyset (cursor) пагинация по первичному ключу (UUIDv7).
+
+    Вместо `OFFSET N` (который заставляет БД прочитать и отбросить N строк) и `COUNT(*)` на каждую страницу
+    следующая страница выбирается условием `id < cursor` по индексу первичного ключа.
+    UUIDv7 монотонно растет со временем создания, поэтому порядок совпадает с сортировкой "новые сверху".
+
+    Attributes:
+        page_size (int): Размер страницы по умолчанию.
+        max_page_size (int): Максимально допустимый размер страницы из запроса.
+    """
+
+    class Input(Schema):
+        """Параметры пагинации из Query Params."""
+
+        cursor: UUID | None = Field(default=None, description="Курсор: ID последнего элемента предыдущей страницы")
+        page_size: int | None = Field(default=None, ge=1, description="Размер страницы")
+
+    class Output(Schema):
+        """Формат ответа со страницей элементов."""
+
+        items: list[Any]
+        next_cursor: UUID | None = Field(default=None, description="Курсор следующей страницы (None - это последняя)")
+
+    def __init__(self, page_size: int = 20, max_page_size: int = 100, **kwargs: Any) -> None:
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        super().__init__(**kwargs)
+
+    def _get_page_size(self, requested_page_size: int | None) -> int:
+        """Возвращает размер страницы с учетом ограничения сверху."""
+        if requested_page_size is None:
+            return self.page_size
+
+        return min(requested_page_size, self.max_page_size)
+
+    @staticmethod
+    def _get_page_queryset(queryset: QuerySet[Any], cursor: UUID | None, page_size: int) -> QuerySet[Any]:
+        """
+        Строит запрос страницы: фильтр по курсору и LIMIT на одну запись больше размера страницы.
+        Лишняя запись не отдается клиенту и нужна только для проверки наличия следующей страницы.
+        """
+        if cursor is not None:
+            queryset = queryset.filter(pk__lt=cursor)
+
+        return queryset.order_by("-pk")[: page_size + 1]
+
+    def _build_page(self, items: list[Any], page_size: int) -> dict[str, Any]:
+        """Формирует ответ: элементы страницы и курсор следующей страницы."""
+        has_next = len(items) > page_size
+        page_items = items[:page_size]
+
+        return {
+            self.items_attribute: page_items,
+            "next_cursor": page_items[-1].pk if has_next else None,
+        }
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet[Any],
+        pagination: Input,
+        request: HttpRequest,
+        **params: Any,
+    ) -> dict[str, Any]:
+        page_size = self._get_page_size(pagination.page_size)
+        items = list(self._get_page_queryset(queryset, pagination.cursor, page_size))
+
+        return self._build_page(items, page_size)
+
+    async def apaginate_queryset(
+        self,
+        queryset: QuerySet[Any],
+        pagination: Input,
+        request: HttpRequest,
+        **params: Any,
+    ) -> dict[str, Any]:
+        page_size = self._get_page_size(pagination.page_size)
+        items = [obj async for obj in self._get_page_queryset(queryset, pagination.cursor, page_size)]
+
+        return self._build_page(items, page_size)
@@ -2,6 +2,7 @@
 Кастомные валидаторы для всего проекта.
 """
 
+from functools import lru_cache
 from typing import Any
 
 import phonenumbers
@@ -11,6 +12,7 @@ from django.core.files import File
 from django.core.validators import RegexValidator
 from django.utils.deconstruct import deconstructible
 from django.utils.translation import gettext_lazy as _
+from django_stubs_ext import StrOrPromise
 
 
 @deconstructible
@@ -43,6 +45,35 @@ class FileSizeValidator:
         return isinstance(other, self.__class__) and self.max_size_mb == other.max_size_mb
 
 
+@lru_cache(maxsize=4096)
+def _get_phone_number_error(phone: str, region: str) -> StrOrPromise | None:
+    """
+    Проверяет телефонный номер через phonenumbers и кэширует результат.
+
+    Разбор номера в phonenumbers дорогой (регулярные выражения и метаданные региона),
+    а одни и те же номера приходят повторно (PATCH контактов, списки контактных лиц).
+
+    Args:
+        phone (str): Телефонный номер.
+        region (str): Регион по умолчанию для номеров в локальном формате.
+
+    Returns:
+        StrOrPromise | None: Сообщение об ошибке или None, если номер валиден.
+    """
+    try:
+        # Пытаемся распарсить номер
+        parsed_phone = phonenumbers.parse(phone, region)
+    except phonenumbers.NumberParseException:
+        # Если библиотека не смогла распарсить номер, он невалиден
+        return _("Номер телефона содержит недопустимые символы")
+
+    # Проверяем, является ли номер валидным
+    if not phonenumbers.is_valid_number(parsed_phone):
+        return _("Введен некорректный телефонный номер. Пример: +375291234567")
+
+    return None
+
+
 def validate_international_phone_number(phone: str) -> None:
     """
     Валидирует телефонный номер с помощью библиотеки phonenumbers.
@@ -52,17 +83,12 @@ def validate_international_phone_number(phone: str) -> None:
     if not phone:
         return None
 
-    try:
-        # Пытаемся распарсить номер
-        parsed_phone = phonenumbers.parse(phone, settings.DEFAULT_PHONE_REGION)
+    error_message = _get_phone_number_error(phone, settings.DEFAULT_PHONE_REGION)
 
-        # Проверяем, является ли номер валидным
-        if not phonenumbers.is_valid_number(parsed_phone):
-            raise ValidationError(_("Введен некорректный телефонный номер. Пример: +375291234567"))
+    if error_message is not None:
+        raise ValidationError(error_message)
 
-    except phonenumbers.NumberParseException:
-        # Если библиотека не смогла распарсить номер, он невалиден
-        raise ValidationError(_("Номер телефона содержит недопустимые символы")) from None
+    return None
 
 
 def validate_phone_pydantic(phone: str | None) -> str | None:
@@ -0,0 +1,29 @@
+# Generated by Django 6.0.2 on 2026-10-15 10:00
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.db.models.fields.json
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # Индексы на таблице событий строятся без блокировки записи (CREATE INDEX CONCURRENTLY)
+    atomic = False
+
+    dependencies = [
+        ('users', '0002_create_system_user'),
+        ('common', '0001_install_trigram'),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name='userevent',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.fields.json.KeyTextTransform('user_email', 'pgh_context')), name='gin_trgm_ops'), name='user_pgh_email_trgm_idx'),
+        ),
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name='userevent',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.fields.json.KeyTextTransform('ip_address', 'pgh_context')), name='gin_trgm_ops'), name='user_pgh_ip_trgm_idx'),
+        ),
+    ]
@@ -6,8 +6,11 @@ import uuid
 from typing import Any
 
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.validators import FileExtensionValidator
 from django.db import models
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Upper
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from pghistory import DeleteEvent, InsertEvent, UpdateEvent
@@ -96,6 +99,17 @@ class Department(BaseModel):
                 models.F("pgh_context__correlation_id"),
                 name="user_pgh_corr_idx",
             ),
+            # Триграммные GIN индексы для поиска в админке аудита (icontains по email и IP инициатора)
+            # Django строит icontains как UPPER(pgh_context ->> 'key') LIKE UPPER(...), поэтому индексируем
+            # именно это выражение - иначе планировщик не сможет использовать индекс
+            GinIndex(
+                OpClass(Upper(KeyTextTransform("user_email", "pgh_context")), name="gin_trgm_ops"),
+                name="user_pgh_email_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper(KeyTextTransform("ip_address", "pgh_context")), name="gin_trgm_ops"),
+                name="user_pgh_ip_trgm_idx",
+            ),
         ],
     },
 )
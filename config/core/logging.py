@@ -75,6 +75,7 @@ def setup_loguru(settings: LoguruSettingsProtocol) -> None:
         level=log_level,
         format=LOG_FORMAT,
         colorize=True,
+        enqueue=True,  # Запись в stderr из фонового потока: обработчик запроса не ждет ввода-вывода
     )
 
     # По умолчанию привязываем пустой ID 'correlation_id', чтобы Loguru не ругался на отсутствие ключа
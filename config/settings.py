@@ -121,6 +121,8 @@ MIDDLEWARE = [
     "whitenoise.middleware.WhiteNoiseMiddleware",  # Эффективная раздача статики
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",  # Middleware для React
+    # ETag для GET-ответов и 304 Not Modified при совпадении If-None-Match (экономит трафик при поллинге)
+    "django.middleware.http.ConditionalGetMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -252,6 +254,10 @@ _DB_DEFAULT["DISABLE_SERVER_SIDE_CURSORS"] = _CURRENT_PORT == 6432
 _CONN_MAX_AGE = 0 if TESTING else env.int("CONN_MAX_AGE", default=60)
 _DB_DEFAULT["CONN_MAX_AGE"] = _CONN_MAX_AGE
 
+# Для постоянных соединений проверяем живость перед переиспользованием в новом запросе
+# (после рестарта БД/PgBouncer запрос не упадет на "мертвом" соединении, а переподключится)
+_DB_DEFAULT["CONN_HEALTH_CHECKS"] = _CONN_MAX_AGE > 0
+
 
 # ==============================================================================
 # CACHE (Redis)
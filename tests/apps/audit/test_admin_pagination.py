@@ -0,0 +1,68 @@
+"""
+Тесты пагинатора журнала аудита в админке (оценочный COUNT).
+"""
+
+from typing import Any
+
+import pytest
+from django.apps import apps
+from django.test import Client as DjangoClient
+from django.urls import reverse
+
+from apps.audit.models import KrononEvents
+from tests.utils.factories import ClientFactory, UserFactory
+
+# Заведомо неверная оценка: если пагинатор ее вернул, значит, точный COUNT не выполнялся
+_FAKE_ESTIMATE = 10_000
+
+
+def _get_changelist_url() -> str:
+    """Возвращает URL списка событий журнала аудита в админке."""
+    return reverse(f"admin:{KrononEvents._meta.app_label}_{KrononEvents._meta.model_name}_changelist")
+
+
+@pytest.fixture
+def superuser_client(client: DjangoClient, monkeypatch: Any) -> DjangoClient:
+    """
+    Создает события клиентов, авторизует суперпользователя и подменяет оценку количества событий.
+
+    Args:
+        client (DjangoClient): Тестовый клиент Django.
+        monkeypatch (Any): Фикстура pytest для подмены оценки.
+
+    Returns:
+        DjangoClient: Клиент Django с сессией суперпользователя.
+    """
+    ClientFactory.create_batch(3)
+
+    client.force_login(UserFactory(is_staff=True, is_superuser=True))
+
+    monkeypatch.setattr("apps.audit.admin._estimate_events_count", lambda: _FAKE_ESTIMATE)
+
+    return client
+
+
+@pytest.mark.django_db
+class TestEstimatedCountPaginator:
+    """Проверка, что оценка по pg_class используется только для списка без фильтров."""
+
+    def test_unfiltered_changelist_uses_estimate(self, superuser_client: DjangoClient) -> None:
+        """Проверка: список без фильтров берет количество из оценки, без COUNT(*) по UNION."""
+        response = superuser_client.get(_get_changelist_url())
+
+        assert response.status_code == 200
+        assert response.context["cl"].result_count == _FAKE_ESTIMATE
+
+    def test_event_model_filter_counts_exactly(self, superuser_client: DjangoClient) -> None:
+        """Проверка: фильтр по модели событий (across() без WHERE) считается точным COUNT."""
+        response = superuser_client.get(_get_changelist_url(), {"event_model": "clients.clientevent"})
+
+        assert response.status_code == 200
+        assert response.context["cl"].result_count == apps.get_model("clients", "ClientEvent").objects.count()
+
+    def test_search_counts_exactly(self, superuser_client: DjangoClient) -> None:
+        """Проверка: поиск по журналу считается точным COUNT."""
+        response = superuser_client.get(_get_changelist_url(), {"q": "nobody@example.com"})
+
+        assert response.status_code == 200
+        assert response.context["cl"].result_count == 0
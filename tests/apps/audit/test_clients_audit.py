@@ -48,7 +48,7 @@ class TestClientHistory(BaseAPITest):
         # Время ответа API
         await self.assert_performance(elapsed_time=elapsed_time, max_ms=300)
 
-        data = history.json()
+        data = history.json()["items"]
 
         # Валидация схемы
         await self.validate_schema(data=data, schema=ClientHistoryOut, many=True)
@@ -69,7 +69,7 @@ class TestClientHistory(BaseAPITest):
         # Проверяем историю в БД напрямую (что в pghistory записался admin_user.id)
         from apps.audit.selectors import get_client_history_queryset
 
-        history = await get_client_history_queryset(client.id)
+        history = [event async for event in get_client_history_queryset(client.id)]
 
         # Проверяем, что в контексте зафиксирован ID админа
         assert str(history[0]["pgh_context"]["user"]) == str(admin_user.id)
@@ -92,7 +92,7 @@ class TestClientHistory(BaseAPITest):
         # Проверяем историю в БД напрямую (что в pghistory записался SYSTEM_USER_ID)
         from apps.audit.selectors import get_client_history_queryset
 
-        history = await get_client_history_queryset(client_id)
+        history = [event async for event in get_client_history_queryset(client_id)]
 
         # Проверяем, что в контексте зафиксирован SYSTEM_USER_ID
         assert str(history[0]["pgh_context"]["user"]) == str(SYSTEM_USER_ID)
@@ -128,7 +128,7 @@ class TestClientHistory(BaseAPITest):
         # Время ответа API
         await self.assert_performance(elapsed_time=elapsed_time, max_ms=300)
 
-        data = history.json()
+        data = history.json()["items"]
         assert len(data) >= 1
 
         # Валидация схемы
@@ -153,7 +153,7 @@ class TestClientHistory(BaseAPITest):
 
         # Запрашиваем историю от имени админа
         history_response = await admin_client.get(f"{self.endpoint}{client.id}")
-        data = history_response.json()
+        data = history_response.json()["items"]
 
         # Получаем событие 'update'
         update_event = next(event for event in data if event["pgh_label"] == "update")
@@ -0,0 +1,49 @@
+"""
+Тесты админки клиентов (сужение SELECT на странице списка).
+"""
+
+from django.contrib import admin
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+
+from apps.clients.admin import ClientAdmin
+from apps.clients.models import Client
+
+
+class TestClientAdminQueryset:
+    """Проверка, что only() применяется только к changelist, а карточка клиента получает полный объект."""
+
+    @staticmethod
+    def _get_queryset_for(url: str) -> tuple[set[str] | frozenset[str], bool]:
+        """
+        Возвращает состояние отложенной загрузки QuerySet'а админки для указанного URL.
+
+        Args:
+            url (str): URL страницы админки.
+
+        Returns:
+            tuple[set[str] | frozenset[str], bool]: Набор полей и флаг режима (True - defer(), False - only()).
+        """
+        request = RequestFactory().get(url)
+        request.resolver_match = resolve(url)
+
+        queryset = ClientAdmin(Client, admin.site).get_queryset(request)
+
+        return queryset.query.deferred_loading
+
+    def test_changelist_queryset_is_narrowed(self) -> None:
+        """Проверка: на странице списка клиентов SELECT сужен через only()."""
+        fields, is_defer = self._get_queryset_for(reverse("admin:clients_client_changelist"))
+
+        assert is_defer is False
+        assert "contact_info" not in fields
+        assert "name" in fields
+
+    def test_change_view_queryset_is_full(self) -> None:
+        """Проверка: карточка клиента читается целиком (без only/defer)."""
+        fields, is_defer = self._get_queryset_for(
+            reverse("admin:clients_client_change", args=["00000000-0000-7000-8000-000000000000"])
+        )
+
+        assert fields == frozenset()
+        assert is_defer is True
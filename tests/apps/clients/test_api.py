@@ -9,7 +9,7 @@ from asgiref.sync import sync_to_async
 from django.test import AsyncClient
 
 from apps.clients.models import Client
-from apps.clients.schemas.client import ClientOut
+from apps.clients.schemas.client import ClientListOut, ClientOut
 from apps.common.schemas import ErrorOut
 from apps.users.models import User
 from tests.utils.base import BaseAPITest
@@ -80,7 +80,7 @@ class TestClientAPI(BaseAPITest):
 
         # Запрашиваем первую страницу
         start = perf_counter()
-        response_page_1 = await auth_client.get(f"{self.endpoint}?page=1")
+        response_page_1 = await auth_client.get(self.endpoint)
         elapsed_time = perf_counter() - start
 
         # --- Проверки ---
@@ -93,15 +93,18 @@ class TestClientAPI(BaseAPITest):
         json_response_page_1: dict[str, Any] = response_page_1.json()
 
         # Валидация схемы
-        await self.validate_schema(data=json_response_page_1["items"], schema=ClientOut, many=True)
+        await self.validate_schema(data=json_response_page_1["items"], schema=ClientListOut, many=True)
 
-        # Проверка структуры пагинации Ninja: {items: [...], count: ...}
+        # Тяжелые поля детальной карточки в список не попадают
+        assert "contact_info" not in json_response_page_1["items"][0]
+
+        # Проверка структуры keyset-пагинации: {items: [...], next_cursor: ...}
         assert len(json_response_page_1["items"]) == 20
-        assert json_response_page_1["count"] == 25
+        assert json_response_page_1["next_cursor"] == json_response_page_1["items"][-1]["id"]
 
-        # Запрашиваем вторую страницу
+        # Запрашиваем вторую страницу по курсору
         start = perf_counter()
-        response_page_2 = await auth_client.get(f"{self.endpoint}?page=2")
+        response_page_2 = await auth_client.get(f"{self.endpoint}?cursor={json_response_page_1['next_cursor']}")
         elapsed_time = perf_counter() - start
 
         # --- Проверки ---
@@ -114,10 +117,15 @@ class TestClientAPI(BaseAPITest):
         json_response_page_2: dict[str, Any] = response_page_2.json()
 
         # Валидация схемы
-        await self.validate_schema(data=json_response_page_2["items"], schema=ClientOut, many=True)
+        await self.validate_schema(data=json_response_page_2["items"], schema=ClientListOut, many=True)
 
-        # Проверка количества элементов второй страницы
+        # Проверка количества элементов второй страницы (последней)
         assert len(json_response_page_2["items"]) == 5
+        assert json_response_page_2["next_cursor"] is None
+
+        # Страницы не пересекаются
+        page_1_ids = {item["id"] for item in json_response_page_1["items"]}
+        assert page_1_ids.isdisjoint(item["id"] for item in json_response_page_2["items"])
 
     async def test_update_client_contact_info_deep_merge(self, admin_client: AsyncClient) -> None:
         """
@@ -163,6 +171,41 @@ class TestClientAPI(BaseAPITest):
         # Проверяем, что телефон не исчез (Deep Merge сработал)
         assert json_response["contact_info"]["general_phone"] == "+375291111111"
 
+    async def test_update_client_contact_info_unchanged(self, admin_client: AsyncClient) -> None:
+        """
+        Проверка PATCH без фактических изменений контактов.
+        Убеждаемся, что запись не сохраняется повторно (updated_at не меняется).
+
+        Args:
+            admin_client (AsyncClient): Авторизованный асинхронный клиент (с правами админа).
+        """
+        # Создаем клиента с контактами
+        client = await sync_to_async(ClientFactory)(contact_info={"general_email": "same@test.com"})
+
+        # Патчим клиента теми же данными
+        patch_response = await admin_client.patch(
+            f"{self.endpoint}{client.id}",
+            data={"contact_info": {"general_email": "same@test.com"}},
+            content_type="application/json",
+        )
+
+        # --- Проверки ---
+
+        # Статус код
+        await self.assert_status(response=patch_response, expected_status=200)
+
+        json_response: dict[str, Any] = patch_response.json()
+
+        # Валидация схемы
+        await self.validate_schema(data=json_response, schema=ClientOut)
+
+        assert json_response["contact_info"]["general_email"] == "same@test.com"
+
+        # Запись в БД не обновлялась
+        updated_at_before = client.updated_at
+        await client.arefresh_from_db()
+        assert client.updated_at == updated_at_before
+
     async def test_soft_delete_and_restore(self, admin_client: AsyncClient) -> None:
         """
         Комплексная проверка Soft Delete и восстановления клиента.
@@ -188,7 +231,7 @@ class TestClientAPI(BaseAPITest):
 
         # Проверяем, что в списке активных его больше нет
         list_response = await admin_client.get(self.endpoint)
-        assert list_response.json()["count"] == 0
+        assert list_response.json()["items"] == []
 
         # Проверяем, что GET по ID выдает 404 (так как селектор фильтрует по active())
         start = perf_counter()
@@ -216,7 +259,7 @@ class TestClientAPI(BaseAPITest):
 
         # Проверяем, что он вернулся в список
         list_response_2 = await admin_client.get(self.endpoint)
-        assert list_response_2.json()["count"] == 1
+        assert len(list_response_2.json()["items"]) == 1
 
         # Проверяем, что он доступен по ID
         start = perf_counter()
@@ -229,3 +272,67 @@ class TestClientAPI(BaseAPITest):
         await self.assert_performance(elapsed_time=elapsed_time, max_ms=300)
         # Валидация схемы
         await self.validate_schema(data=restore_response.json(), schema=ClientOut)
+
+    async def test_delete_not_found(self, admin_client: AsyncClient) -> None:
+        """
+        Проверка удаления несуществующего (или уже удаленного) клиента: UPDATE не затронул строк -> 404.
+
+        Args:
+            admin_client (AsyncClient): Авторизованный асинхронный клиент (с правами админа).
+        """
+        # Создаем и сразу мягко удаляем клиента
+        client = await sync_to_async(ClientFactory)()
+        await client.adelete()
+
+        # Повторное удаление
+        start = perf_counter()
+        del_response = await admin_client.delete(f"{self.endpoint}{client.id}")
+        elapsed_time = perf_counter() - start
+
+        # --- Проверки ---
+
+        # Статус код
+        await self.assert_status(response=del_response, expected_status=404)
+        # Время ответа API
+        await self.assert_performance(elapsed_time=elapsed_time, max_ms=300)
+        # Валидация схемы
+        await self.validate_schema(data=del_response.json(), schema=ErrorOut)
+
+    async def test_get_client_not_modified(self, admin_client: AsyncClient) -> None:
+        """
+        Проверка условного GET: повторный запрос с актуальным ETag возвращает 304 без тела.
+
+        Args:
+            admin_client (AsyncClient): Авторизованный асинхронный клиент (с правами админа).
+        """
+        # Создаем клиента
+        client = await sync_to_async(ClientFactory)()
+
+        # Первый запрос: получаем данные и ETag
+        response = await admin_client.get(f"{self.endpoint}{client.id}")
+        await self.assert_status(response=response, expected_status=200)
+
+        etag = response.headers["ETag"]
+        assert etag
+
+        # Повторный запрос с If-None-Match
+        start = perf_counter()
+        not_modified_response = await admin_client.get(f"{self.endpoint}{client.id}", headers={"if-none-match": etag})
+        elapsed_time = perf_counter() - start
+
+        # --- Проверки ---
+
+        # Статус код
+        await self.assert_status(response=not_modified_response, expected_status=304)
+        # Время ответа API
+        await self.assert_performance(elapsed_time=elapsed_time, max_ms=300)
+
+        assert not_modified_response.content == b""
+
+        # После изменения клиента ETag устаревает
+        await admin_client.patch(
+            f"{self.endpoint}{client.id}", data={"name": "Changed"}, content_type="application/json"
+        )
+        changed_response = await admin_client.get(f"{self.endpoint}{client.id}", headers={"if-none-match": etag})
+
+        await self.assert_status(response=changed_response, expected_status=200)
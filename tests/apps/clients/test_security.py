@@ -8,7 +8,7 @@ from typing import Any
 from asgiref.sync import sync_to_async
 from django.test import AsyncClient
 
-from apps.clients.schemas.client import ClientOut
+from apps.clients.schemas.client import ClientListOut, ClientOut
 from apps.common.schemas import ErrorOut
 from apps.users.models import User, UserRole
 from tests.utils.base import BaseAPITest
@@ -58,10 +58,10 @@ class TestClientSecurity(BaseAPITest):
         json_response: dict[str, Any] = response.json()
 
         # Валидация схемы
-        await self.validate_schema(data=json_response["items"], schema=ClientOut, many=True)
+        await self.validate_schema(data=json_response["items"], schema=ClientListOut, many=True)
 
         # Проверяем, что в списке только my_client
-        assert json_response["count"] == 1
+        assert len(json_response["items"]) == 1
         assert json_response["items"][0]["id"] == str(my_client.id)
         assert json_response["items"][0]["name"] == "My Client"
 
@@ -286,9 +286,9 @@ class TestClientSecurity(BaseAPITest):
         json_response: dict[str, Any] = list_response.json()
 
         # Валидация схемы
-        await self.validate_schema(data=json_response["items"], schema=ClientOut, many=True)
+        await self.validate_schema(data=json_response["items"], schema=ClientListOut, many=True)
 
-        assert json_response["count"] >= 5
+        assert len(json_response["items"]) >= 5
 
         # --- Создание клиента ---
 
@@ -0,0 +1,53 @@
+"""
+Тесты селекторов клиентов (количество SQL-запросов).
+"""
+
+from typing import Any
+
+import pytest
+
+from apps.clients.selectors import get_client_queryset
+from apps.users.constants import SYSTEM_USER_ID
+from tests.utils.factories import ClientFactory, DepartmentFactory, UserFactory
+
+
+@pytest.mark.django_db
+class TestClientSelectors:
+    """Проверка отсутствия N+1 запросов при чтении клиентов со связями."""
+
+    def test_client_list_related_objects_single_query(self, django_assert_num_queries: Any) -> None:
+        """
+        Проверка: страница клиентов со всеми связями (отдел + 4 ответственных) читается одним запросом.
+
+        Args:
+            django_assert_num_queries (Any): Фикстура pytest-django для подсчета SQL-запросов.
+        """
+        # Создаем клиентов со всеми заполненными связями
+        for _ in range(3):
+            ClientFactory(
+                department=DepartmentFactory(),
+                accountant=UserFactory(),
+                primary_accountant=UserFactory(),
+                payroll_accountant=UserFactory(),
+                hr_specialist=UserFactory(),
+            )
+
+        # Читаем страницу и обращаемся ко всем полям связей, которые сериализует ClientListOut
+        with django_assert_num_queries(1):
+            clients = list(get_client_queryset(user_id=SYSTEM_USER_ID, is_admin=True)[:20])
+
+            for client in clients:
+                assert client.department is not None
+                assert client.department.name
+
+                for user in (
+                    client.accountant,
+                    client.primary_accountant,
+                    client.payroll_accountant,
+                    client.hr_specialist,
+                ):
+                    assert user is not None
+                    assert user.email
+                    assert user.full_name_rus
+
+        assert len(clients) == 3
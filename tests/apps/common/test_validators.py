@@ -0,0 +1,29 @@
+"""
+Тесты валидатора телефонных номеров (с кэшированием результата разбора).
+"""
+
+import pytest
+from django.core.exceptions import ValidationError
+
+from apps.common.validators import validate_international_phone_number, validate_phone_pydantic
+
+
+class TestPhoneValidators:
+    """Проверка, что кэширование разбора номера не меняет результат валидации."""
+
+    def test_valid_phone_repeated(self) -> None:
+        """Проверка: валидный номер проходит проверку и при повторном (кэшированном) вызове."""
+        for _ in range(2):
+            assert validate_phone_pydantic("+375291234567") == "+375291234567"
+
+    def test_invalid_phone_repeated(self) -> None:
+        """Проверка: невалидный номер отклоняется и при повторном (кэшированном) вызове."""
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                validate_international_phone_number("+375000")
+
+    def test_unparsable_phone_pydantic(self) -> None:
+        """Проверка: неразбираемый номер превращается в ValueError для Pydantic."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="недопустимые символы"):
+                validate_phone_pydantic("not a phone")